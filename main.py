@@ -5,8 +5,9 @@ import sys
 import json
 from pathlib import Path
 from dotenv import load_dotenv
-from src.agent import create_ui_file_from_image
-from src.converter import json_to_lua_string
+from src.agent import create_ui_file_from_image, continue_ui_json
+from src.converter import LuaConverter, json_to_lua_string
+from src.json_recovery import JsonRecovery, TruncatedJsonError
 
 def setup_environment():
     """환경 변수 및 설정 검증"""
@@ -36,6 +37,38 @@ def validate_image_file(image_path: str) -> bool:
     
     return True
 
+def convert_model_json(json_result: str, image_path: str, verbose: bool = False) -> str:
+    """모델 응답 JSON을 Lua 형식으로 변환 (잘린 경우 나머지 부분만 재요청)
+
+    잘린 응답을 로컬 복구만으로 처리하면 잘린 뒤의 UI 요소가 조용히 누락되므로,
+    재요청으로 누락 부분을 받고 실패할 때만 완성된 노드까지 복구한 결과를 사용합니다.
+    """
+    try:
+        return json_to_lua_string(json_result)
+    except TruncatedJsonError as e:
+        truncated = e
+    
+    print("⚠️ 응답 JSON이 중간에 잘렸습니다. 나머지 부분만 재요청합니다.")
+    try:
+        continuation = JsonRecovery.strip_fence_lines(continue_ui_json(image_path, truncated.partial_json))
+        json_content = truncated.partial_json + continuation
+        
+        if verbose:
+            print(f"📄 이어 붙인 JSON:\n{json_content[:200]}...")
+        
+        return json_to_lua_string(json_content)
+    except Exception as retry_error:
+        # 재요청 결과도 잘렸다면 원래 응답을 포함하므로 재요청 쪽 복구 결과를 우선 사용
+        salvaged = truncated.salvaged
+        if isinstance(retry_error, TruncatedJsonError) and retry_error.salvaged is not None:
+            salvaged = retry_error.salvaged
+        if salvaged is None:
+            raise truncated from retry_error
+        
+        print(f"⚠️ 재요청 실패: {retry_error}")
+        print("⚠️ 잘리기 전까지 완성된 노드만으로 생성합니다. 일부 UI 요소가 누락되었습니다.")
+        return LuaConverter.data_to_lua_string(salvaged)
+
 def generate_ui_file(image_path: str, output_path: str = None, verbose: bool = False):
     """UI 파일 생성 메인 로직"""
     
@@ -63,20 +96,8 @@ def generate_ui_file(image_path: str, output_path: str = None, verbose: bool = F
             print("📋 JSON 데이터 생성 완료")
             print(f"📄 전체 응답:\n{json_result}")
         
-        # JSON 응답에서 실제 JSON 부분만 추출 (마크다운 코드 블록 제거)
-        json_content = json_result.strip()
-        if json_content.startswith('```json'):
-            json_content = json_content[7:]  # ```json 제거
-        if json_content.endswith('```'):
-            json_content = json_content[:-3]  # ``` 제거
-        json_content = json_content.strip()
-        
-        if verbose:
-            print(f"📄 정제된 JSON:\n{json_content[:200]}...")
-        
-        # 5. JSON을 Lua 형식으로 변환
-        
-        lua_content = json_to_lua_string(json_content)
+        # 5. JSON을 Lua 형식으로 변환 (후행 쉼표 등은 로컬 복구, 잘린 경우 나머지만 재요청)
+        lua_content = convert_model_json(json_result, image_path, verbose)
         
         # 6. 최종 .ui 파일 형태로 래핑 (UILoader.lua 호환)
         final_ui_content = f"""{lua_content};"""
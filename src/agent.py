@@ -5,19 +5,25 @@ from google.genai import types
 from PIL import Image
 from src.schema import UINode  # 2.1에서 정의한 스키마 임포트
 
-def create_ui_file_from_image(image_path: str) -> str:
-    """
-    이미지 시안을 분석하여 .ui 파일 내용을 생성합니다.
-    """
+MODEL_NAME = 'gemini-2.0-flash-exp'  # Vision을 지원하는 모델
+
+def _create_client() -> genai.Client:
+    """환경 변수의 API 키로 Gemini 클라이언트 생성"""
     # .env 파일 로드
     load_dotenv()
     
-    # 1. 클라이언트 초기화 (환경 변수에서 API 키 읽기)
     api_key = os.getenv('GOOGLE_AI_API_KEY')
     if not api_key:
         raise ValueError("GOOGLE_AI_API_KEY가 .env 파일 또는 환경 변수에 설정되지 않았습니다.")
     
-    client = genai.Client(api_key=api_key)
+    return genai.Client(api_key=api_key)
+
+def create_ui_file_from_image(image_path: str) -> str:
+    """
+    이미지 시안을 분석하여 .ui 파일 내용을 생성합니다.
+    """
+    # 1. 클라이언트 초기화 (환경 변수에서 API 키 읽기)
+    client = _create_client()
 
     # 2. 이미지 로드
     img = Image.open(image_path)
@@ -102,7 +108,7 @@ def create_ui_file_from_image(image_path: str) -> str:
     
     # Gemini 요청 (Vision)
     response = client.models.generate_content(
-        model='gemini-2.0-flash-exp', # Vision을 지원하는 모델
+        model=MODEL_NAME,
         contents=[
             system_instruction,
             f"""이 UI 시안 이미지를 분석하여 다음 규칙에 따라 JSON 형식으로 변환해주세요:
@@ -144,4 +150,35 @@ def create_ui_file_from_image(image_path: str) -> str:
     json_data = response.text
     # json_to_lua_converter(json_data) 함수가 필요함
     # 예시를 위해 단순 반환
-    return json_data
\ No newline at end of file
+    return json_data
+
+def continue_ui_json(image_path: str, partial_json: str) -> str:
+    """
+    중간에 잘린 JSON 응답의 나머지 부분만 이어서 생성합니다.
+    반환값은 partial_json 바로 뒤에 이어 붙일 텍스트입니다.
+    
+    어떤 노드가 이미 작성되었는지와 끊긴 위치를 알아야 하므로 partial_json 전체를,
+    남은 UI 요소를 식별해야 하므로 이미지를 함께 보냅니다. 이는 입력 토큰만 늘리고,
+    응답 지연을 좌우하는 출력 토큰은 누락된 부분만큼만 생성되므로
+    전체를 다시 생성하는 것보다 비용과 지연이 작습니다.
+    """
+    client = _create_client()
+    img = Image.open(image_path)
+    
+    response = client.models.generate_content(
+        model=MODEL_NAME,
+        contents=[
+            f"""이전에 이 UI 시안 이미지를 분석한 JSON 응답이 중간에 끊겼습니다.
+				아래는 지금까지 받은 JSON입니다:
+
+				{partial_json}
+
+				**중요**:
+				- 위 JSON의 마지막 문자 바로 다음부터 이어지는 나머지 부분만 출력하세요
+				- 이미 출력된 내용을 반복하지 마세요
+				- 마크다운 코드 블록이나 다른 설명 텍스트는 포함하지 마세요""",
+            img
+        ]
+    )
+    
+    return response.text
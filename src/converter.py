@@ -1,5 +1,5 @@
-import json
 from typing import Dict, Any, List
+from src.json_recovery import JsonRecovery
 
 class UILoaderConfig:
     """UILoader.lua 관련 설정 상수들"""
@@ -187,12 +187,14 @@ class LuaConverter:
     
     @staticmethod
     def json_to_lua_string(json_string: str) -> str:
-        """JSON 문자열을 Lua 테이블 문자열로 변환"""
-        try:
-            data = json.loads(json_string)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"JSON 파싱 오류: {e}")
+        """JSON 문자열을 Lua 테이블 문자열로 변환 (잘리거나 깨진 JSON은 로컬 복구)"""
+        data = JsonRecovery.parse(json_string)
         
+        return LuaConverter.data_to_lua_string(data)
+    
+    @staticmethod
+    def data_to_lua_string(data: Dict[str, Any]) -> str:
+        """파싱된 루트 노드 dict를 Lua 테이블 문자열로 변환"""
         return LuaConverter._convert_node(data, "")
     
     @staticmethod
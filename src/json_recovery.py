@@ -0,0 +1,266 @@
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class TruncatedJsonError(ValueError):
+    """모델 응답 JSON이 중간에 잘린 경우의 오류
+
+    partial_json: 잘린 지점까지의 JSON 텍스트 (나머지 부분 재요청에 사용)
+    salvaged: 완전히 작성된 노드만 남겨 복구한 루트 노드 (복구 불가 시 None)
+    """
+
+    def __init__(self, message: str, partial_json: str, salvaged: Optional[Dict[str, Any]]):
+        super().__init__(message)
+        self.partial_json = partial_json
+        self.salvaged = salvaged
+
+
+class JsonRecovery:
+    """모델 응답에서 JSON을 추출하고 흔한 결함을 로컬에서 복구하는 파서"""
+
+    # 자식 노드 배열의 키 (완전한 자식 노드만 남기는 기준)
+    CHILDREN_KEY = 'children'
+
+    @staticmethod
+    def parse(text: str) -> Dict[str, Any]:
+        """응답 텍스트를 루트 노드 dict로 파싱
+
+        복구 불가 시 ValueError, 응답이 잘린 경우 TruncatedJsonError를 발생시킵니다.
+        """
+        candidate = JsonRecovery.extract_json_block(text)
+        if candidate is None:
+            raise ValueError("JSON 파싱 오류: 응답에서 JSON 객체를 찾을 수 없습니다")
+
+        if JsonRecovery._find_object_end(candidate, 0) is None:
+            if JsonRecovery._prefix_error_pos(candidate) is not None:
+                raise ValueError("JSON 파싱 오류: 닫히지 않은 JSON 객체가 유효하지 않습니다")
+            raise TruncatedJsonError(
+                "JSON 파싱 오류: 응답이 중간에 잘렸습니다",
+                candidate,
+                JsonRecovery.salvage_truncated(candidate),
+            )
+
+        try:
+            data = JsonRecovery._load(candidate)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON 파싱 오류: {e}")
+        if not isinstance(data, dict) or not data:
+            raise ValueError("JSON 파싱 오류: 루트 노드가 비어 있습니다")
+        return data
+
+    @staticmethod
+    def extract_json_block(text: str) -> Optional[str]:
+        """텍스트에서 가장 바깥 JSON 객체를 추출 (잘린 경우 끝까지 반환)
+
+        '{' 위치마다 차례로 시도하여 dict로 파싱되는 첫 객체나 잘린 JSON을 반환합니다.
+        잘린 JSON은 이어 붙일 수 있도록 끝의 코드 블록 표시만 제거하고 공백은 보존합니다.
+        해당하는 객체가 없으면 가장 긴 객체를 반환해 원래 오류가 드러나게 합니다.
+        """
+        fallback: Optional[str] = None
+        start = text.find('{')
+        while start != -1:
+            end = JsonRecovery._find_object_end(text, start)
+            if end is None:
+                block = JsonRecovery._remove_closing_fence(text[start:])
+                error_pos = JsonRecovery._prefix_error_pos(block)
+                if error_pos is None:
+                    return block
+                # 설명 텍스트의 닫히지 않은 '{'는 건너뛰되, 오류 위치 앞의 '{'는
+                # JSON 내부에 중첩된 객체이므로 루트로 오인하지 않도록 오류 위치부터 탐색
+                if fallback is None:
+                    fallback = block
+                start = text.find('{', start + max(error_pos, 1))
+                continue
+
+            candidate = text[start:end + 1]
+            try:
+                if isinstance(JsonRecovery._load(candidate), dict):
+                    return candidate
+            except json.JSONDecodeError:
+                pass
+            if fallback is None or len(candidate) > len(fallback):
+                fallback = candidate
+            # 파싱되지 않은 객체 내부의 '{'는 건너뜀 (깨진 루트의 자식을 루트로 오인 방지)
+            start = text.find('{', end + 1)
+
+        return fallback
+
+    @staticmethod
+    def strip_fence_lines(text: str) -> str:
+        """텍스트 앞뒤의 마크다운 코드 블록 표시 줄만 제거 (내용의 공백은 보존)"""
+        if text.lstrip().startswith('```'):
+            newline = text.find('\n')
+            text = text[newline + 1:] if newline != -1 else ''
+        return JsonRecovery._remove_closing_fence(text)
+
+    @staticmethod
+    def remove_trailing_commas(text: str) -> str:
+        """문자열 밖의 '}' 또는 ']' 바로 앞 쉼표 제거"""
+        result = []
+        in_string = False
+        escaped = False
+        length = len(text)
+        for i, char in enumerate(text):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == ',':
+                j = i + 1
+                while j < length and text[j].isspace():
+                    j += 1
+                if j < length and text[j] in '}]':
+                    continue
+            result.append(char)
+        return ''.join(result)
+
+    @staticmethod
+    def salvage_truncated(text: str) -> Optional[Dict[str, Any]]:
+        """잘린 JSON에서 완전히 작성된 자식 노드만 남긴 루트 노드 반환 (복구 불가 시 None)"""
+        closed = JsonRecovery.close_truncated(JsonRecovery.remove_trailing_commas(text))
+        try:
+            data = json.loads(closed)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict) or 'type' not in data:
+            return None
+        return data
+
+    @staticmethod
+    def close_truncated(text: str) -> str:
+        """잘린 JSON을 마지막 안전 지점까지 자르고 열린 괄호를 닫음
+
+        루트 노드와 루트의 children 배열만 열려 있는 위치를 안전 지점으로 보므로,
+        자식 노드는 객체가 실제로 닫힌 경우에만 남습니다.
+        """
+        stack: List[Tuple[str, Optional[str]]] = []
+        safe_point: Optional[Tuple[int, Tuple[Tuple[str, Optional[str]], ...]]] = None
+        in_string = False
+        escaped = False
+        string_start = 0
+        last_string: Optional[str] = None
+        pending_key: Optional[str] = None
+
+        for i, char in enumerate(text):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+                    last_string = text[string_start + 1:i]
+                continue
+
+            if char == '"':
+                in_string = True
+                string_start = i
+            elif char == ':':
+                pending_key = last_string
+            elif char in '{[':
+                key = pending_key if char == '[' else None
+                stack.append((char, key))
+                pending_key = None
+                if JsonRecovery._is_safe(stack):
+                    safe_point = (i + 1, tuple(stack))
+            elif char in '}]':
+                if not stack:
+                    break
+                stack.pop()
+                pending_key = None
+                if not stack:
+                    # 완결된 JSON이므로 복구할 필요 없음
+                    return text[:i + 1]
+                if JsonRecovery._is_safe(stack):
+                    safe_point = (i + 1, tuple(stack))
+            elif char == ',':
+                pending_key = None
+                if JsonRecovery._is_safe(stack):
+                    safe_point = (i, tuple(stack))
+
+        if safe_point is None:
+            return text
+
+        cut, open_stack = safe_point
+        closers = ''.join('}' if opener == '{' else ']' for opener, _ in reversed(open_stack))
+        return JsonRecovery.remove_trailing_commas(text[:cut].rstrip() + closers)
+
+    @staticmethod
+    def _is_safe(stack: List[Tuple[str, Optional[str]]]) -> bool:
+        """루트 노드 또는 루트의 children 배열만 열린 상태인지 판단"""
+        if not stack or stack[0][0] != '{':
+            return False
+        if len(stack) == 1:
+            return True
+        return len(stack) == 2 and stack[1] == ('[', JsonRecovery.CHILDREN_KEY)
+
+    @staticmethod
+    def _find_object_end(text: str, start: int) -> Optional[int]:
+        """start 위치의 '{'에 대응하는 닫는 괄호 위치 반환 (닫히지 않으면 None)"""
+        depth = 0
+        in_string = False
+        escaped = False
+        for i in range(start, len(text)):
+            char = text[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in '{[':
+                depth += 1
+            elif char in '}]':
+                depth -= 1
+                if depth == 0:
+                    return i
+        return None
+
+    @staticmethod
+    def _load(text: str) -> Any:
+        """원본 그대로 파싱하고, 실패하면 후행 쉼표 제거 후 재시도 (실패 시 원래 오류)"""
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            try:
+                return json.loads(JsonRecovery.remove_trailing_commas(text))
+            except json.JSONDecodeError:
+                raise e
+
+    @staticmethod
+    def _remove_closing_fence(text: str) -> str:
+        """끝에 있는 코드 블록 닫힘 표시 줄만 제거"""
+        stripped = text.rstrip()
+        if not stripped.endswith('```'):
+            return text
+        stripped = stripped[:-3]
+        return stripped[:-1] if stripped.endswith('\n') else stripped
+
+    @staticmethod
+    def _prefix_error_pos(text: str) -> Optional[int]:
+        """중간에 잘린 유효한 JSON의 앞부분이면 None, 아니면 오류 위치 반환"""
+        cleaned = JsonRecovery.remove_trailing_commas(text)
+        try:
+            json.loads(cleaned)
+            return None
+        except json.JSONDecodeError as e:
+            if e.msg.startswith('Unterminated string'):
+                return None
+            # 오류 위치 이후가 끝까지 잘린 리터럴/숫자 조각뿐이면 잘린 것으로 판단
+            tail = cleaned[e.pos:].rstrip()
+            if (
+                not tail
+                or any(literal.startswith(tail) for literal in ('true', 'false', 'null'))
+                or re.fullmatch(r'[-+0-9.eE]+', tail) is not None
+            ):
+                return None
+            return e.pos
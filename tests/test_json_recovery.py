@@ -0,0 +1,121 @@
+import pytest
+
+from src.json_recovery import JsonRecovery, TruncatedJsonError
+
+VALID_JSON = '{"type": "CCTouchNode", "x": 0.0, "children": [{"type": "CCSprite", "x": 1.0}]}'
+
+
+def test_parse_valid_json():
+    data = JsonRecovery.parse(VALID_JSON)
+    assert data['type'] == 'CCTouchNode'
+    assert data['children'] == [{'type': 'CCSprite', 'x': 1.0}]
+
+
+def test_parse_strips_code_fence_and_surrounding_prose():
+    text = f"Here is the UI:\n```json\n{VALID_JSON}\n```\nHope this helps."
+    assert JsonRecovery.parse(text)['type'] == 'CCTouchNode'
+
+
+def test_parse_json_followed_by_fenced_block():
+    text = f"{VALID_JSON}\n\nExample usage:\n```lua\nlocal ui = {{ x = 1 }}\n```\n"
+    assert JsonRecovery.parse(text)['type'] == 'CCTouchNode'
+
+
+def test_parse_skips_braces_in_leading_prose():
+    text = f"Result {{see below}}:\n{VALID_JSON}"
+    assert JsonRecovery.parse(text)['type'] == 'CCTouchNode'
+
+
+def test_parse_skips_unclosed_brace_in_leading_prose():
+    text = 'Result {see below:\n{"type": "A", "children": []}'
+    assert JsonRecovery.parse(text) == {'type': 'A', 'children': []}
+
+
+def test_parse_removes_trailing_commas():
+    text = '{"type": "CCTouchNode", "anchorpoint": [0.5, 0.5,], "children": [{"type": "CCSprite",},],}'
+    data = JsonRecovery.parse(text)
+    assert data['anchorpoint'] == [0.5, 0.5]
+    assert data['children'] == [{'type': 'CCSprite'}]
+
+
+def test_parse_keeps_braces_inside_strings():
+    data = JsonRecovery.parse('{"type": "CCStylishLabelTTF", "text": "a\\"}b{"}')
+    assert data['text'] == 'a"}b{'
+
+
+@pytest.mark.parametrize('text', [
+    "no json here",
+    '{"type": True}',
+    "{'type': 'CCSprite'}",
+    '{"type": "CCSprite" // comment\n}',
+    '{}',
+])
+def test_parse_unrecoverable_raises_value_error(text):
+    with pytest.raises(ValueError) as excinfo:
+        JsonRecovery.parse(text)
+    assert not isinstance(excinfo.value, TruncatedJsonError)
+
+
+def test_parse_malformed_root_is_not_replaced_by_child():
+    text = '{"type": "CCTouchNode", "visible": True, "children": [{"type": "CCSprite"}]}'
+    with pytest.raises(ValueError):
+        JsonRecovery.parse(text)
+
+
+def test_truncated_keeps_only_closed_children():
+    text = (
+        '```json\n{"type": "CCTouchNode", "x": 0, "anchorpoint": [0.5, 0.5], "children": ['
+        '{"type": "CCSprite", "x": 1, "anchorpoint": [0, 0]}, '
+        '{"type": "CCButton", "x": 2, "anchorpoint": [0.5,'
+    )
+    with pytest.raises(TruncatedJsonError) as excinfo:
+        JsonRecovery.parse(text)
+    error = excinfo.value
+    assert error.partial_json.startswith('{"type": "CCTouchNode"')
+    assert error.salvaged == {
+        'type': 'CCTouchNode', 'x': 0, 'anchorpoint': [0.5, 0.5],
+        'children': [{'type': 'CCSprite', 'x': 1, 'anchorpoint': [0, 0]}],
+    }
+
+
+def test_truncated_drops_child_cut_after_its_children():
+    text = '{"type": "R", "children": [{"type": "A", "children": [{"type": "c"}], "var": "a", "x": 1'
+    with pytest.raises(TruncatedJsonError) as excinfo:
+        JsonRecovery.parse(text)
+    assert excinfo.value.salvaged == {'type': 'R', 'children': []}
+
+
+def test_truncated_root_keeps_completed_properties():
+    with pytest.raises(TruncatedJsonError) as excinfo:
+        JsonRecovery.parse('{"type": "CCTouchNode", "x": 0, "na')
+    assert excinfo.value.salvaged == {'type': 'CCTouchNode', 'x': 0}
+
+
+def test_truncated_root_without_type_is_not_salvaged():
+    with pytest.raises(TruncatedJsonError) as excinfo:
+        JsonRecovery.parse('{"children": [{"type": "A"}], {"ty')
+    assert excinfo.value.salvaged is None
+
+
+def test_truncated_partial_json_can_be_continued():
+    text = VALID_JSON[:40]
+    with pytest.raises(TruncatedJsonError) as excinfo:
+        JsonRecovery.parse(text)
+    assert JsonRecovery.parse(excinfo.value.partial_json + VALID_JSON[40:]) == JsonRecovery.parse(VALID_JSON)
+
+
+def test_truncated_inside_string_keeps_whitespace_for_continuation():
+    text = '```json\n{"type": "R", "children": [{"type": "CCStylishLabelTTF", "text": "게임 '
+    with pytest.raises(TruncatedJsonError) as excinfo:
+        JsonRecovery.parse(text)
+    partial_json = excinfo.value.partial_json
+    assert partial_json.endswith('"게임 ')
+
+    continuation = JsonRecovery.strip_fence_lines('```json\n 시작"}]}\n```')
+    data = JsonRecovery.parse(partial_json + continuation)
+    assert data['children'][0]['text'] == '게임  시작'
+
+
+def test_strip_fence_lines_keeps_content_whitespace():
+    assert JsonRecovery.strip_fence_lines('```json\n  "a"}\n```\n') == '  "a"}'
+    assert JsonRecovery.strip_fence_lines(' "a"}') == ' "a"}'
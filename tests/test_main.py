@@ -0,0 +1,62 @@
+import pytest
+
+import main
+from src.json_recovery import TruncatedJsonError
+
+PARTIAL_JSON = '{"type": "R", "x": 0, "children": [{"type": "A", "x": 1}, {"type": "B", "x": '
+
+
+def test_convert_model_json_continuation_succeeds(monkeypatch):
+    requests = []
+
+    def fake_continue(image_path, partial_json):
+        requests.append(partial_json)
+        return '```json\n2}]}\n```'
+
+    monkeypatch.setattr(main, 'continue_ui_json', fake_continue)
+    lua_content = main.convert_model_json(PARTIAL_JSON, 'image.png')
+
+    assert requests == [PARTIAL_JSON]
+    assert "type = 'A';" in lua_content
+    assert "type = 'B';" in lua_content
+
+
+def test_convert_model_json_continuation_truncated_uses_retry_salvage(monkeypatch, capsys):
+    monkeypatch.setattr(main, 'continue_ui_json',
+                        lambda image_path, partial_json: '2}, {"type": "C", "x": ')
+    lua_content = main.convert_model_json(PARTIAL_JSON, 'image.png')
+
+    assert "type = 'A';" in lua_content
+    assert "type = 'B';" in lua_content
+    assert "type = 'C';" not in lua_content
+    assert '누락' in capsys.readouterr().out
+
+
+def test_convert_model_json_continuation_error_uses_salvage(monkeypatch, capsys):
+    def fake_continue(image_path, partial_json):
+        raise RuntimeError("network")
+
+    monkeypatch.setattr(main, 'continue_ui_json', fake_continue)
+    lua_content = main.convert_model_json(PARTIAL_JSON, 'image.png')
+
+    assert "type = 'A';" in lua_content
+    assert "type = 'B';" not in lua_content
+    assert '누락' in capsys.readouterr().out
+
+
+def test_convert_model_json_without_salvage_reraises(monkeypatch):
+    def fake_continue(image_path, partial_json):
+        raise RuntimeError("network")
+
+    monkeypatch.setattr(main, 'continue_ui_json', fake_continue)
+    with pytest.raises(TruncatedJsonError):
+        main.convert_model_json('{"ty', 'image.png')
+
+
+def test_convert_model_json_malformed_does_not_request_continuation(monkeypatch):
+    def fake_continue(image_path, partial_json):
+        pytest.fail("continuation requested for a complete object")
+
+    monkeypatch.setattr(main, 'continue_ui_json', fake_continue)
+    with pytest.raises(ValueError):
+        main.convert_model_json('{"type": True}', 'image.png')